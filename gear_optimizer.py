@@ -6,11 +6,13 @@
 
 import math
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, List
 
 # 导入材料校核模块
-from material_check import MaterialDatabase, StrengthChecker, MaterialCheckResult
+from material_check import (
+    MaterialDatabase, StrengthChecker, MaterialCheckResult, GearStresses, GearMaterials
+)
 
 # 导入报告生成模块
 from report_generator import print_result
@@ -113,32 +115,18 @@ class GearResult:
     output_torque: float
     width_factor1: float  # 第一级齿宽系数
     width_factor2: float  # 第二级齿宽系数
-    stress_details: Dict[str, float] = None  # 各齿轮应力详情
+    stress_details: Optional[GearStresses] = None  # 各齿轮应力详情
     max_stress_gear: str = ""  # 最大应力所在齿轮
-    gear_materials: Dict[str, str] = None  # 各齿轮材质键名
-    gear_material_names: Dict[str, str] = None  # 各齿轮材质名称
-    tip_relief_amounts: Dict[str, float] = None  # 各齿轮修缘量(mm)
+    gear_materials: Optional[GearMaterials] = None  # 各齿轮材质键名（混合材质时）
+    gear_material_names: Dict[str, str] = field(default_factory=dict)  # 各齿轮材质名称
+    tip_relief_amounts: Dict[str, float] = field(default_factory=dict)  # 各齿轮修缘量(mm)
     tip_relief1: float = 0.0  # 第一级修缘系数
     tip_relief2: float = 0.0  # 第二级修缘系数
     helix_angle1: float = 0.0  # 第一级螺旋角
     helix_angle2: float = 0.0  # 第二级螺旋角
-    contact_ratios: Dict[str, float] = None  # 重合度
-    stress_ratios: Dict[str, float] = None  # 各齿轮应力比
+    contact_ratios: Dict[str, float] = field(default_factory=dict)  # 重合度
+    stress_ratios: Dict[str, float] = field(default_factory=dict)  # 各齿轮应力比
     max_stress_ratio_gear: str = ""  # 最大应力比所在齿轮描述
-    
-    def __post_init__(self):
-        if self.stress_details is None:
-            self.stress_details = {}
-        if self.gear_materials is None:
-            self.gear_materials = {}
-        if self.gear_material_names is None:
-            self.gear_material_names = {}
-        if self.tip_relief_amounts is None:
-            self.tip_relief_amounts = {}
-        if self.contact_ratios is None:
-            self.contact_ratios = {}
-        if self.stress_ratios is None:
-            self.stress_ratios = {}
 
 
 # ==================== 核心优化器 ====================
@@ -249,7 +237,7 @@ class GearOptimizer:
             # 硬约束模式：检查每个指定材质是否都满足
             if cfg.strict_material_check and result.gear_materials:
                 for gear_key, mat_key in material_config.items():
-                    actual_mat = result.gear_materials.get(gear_key, '')
+                    actual_mat = getattr(result.gear_materials, gear_key, '')
                     # 如果实际材质与指定材质不一致，说明指定材质不满足
                     if actual_mat != mat_key:
                         if stats:
@@ -261,11 +249,10 @@ class GearOptimizer:
 
             if cfg.strict_material_check:
                 # 硬约束模式：只校核指定材质，不允许自动切换
-                selected_key, results = self.strength_checker.select_best_material(
-                    self.material_db, m1, m2, z1, z2, z3, z4,
-                    width1, width2, torque1, torque2, mode=specified_material
+                result = self.strength_checker.check_material(
+                    self.material_db[specified_material], m1, m2, z1, z2, z3, z4,
+                    width1, width2, torque1, torque2
                 )
-                result = results[specified_material]
                 # 检查指定材质是否满足
                 if not result.suitable:
                     if stats:
@@ -286,7 +273,7 @@ class GearOptimizer:
             return None  # 没有材料满足
         
         # 找出最大应力所在齿轮
-        max_stress_gear = max(result.stress_details.items(), key=lambda x: x[1])[0]
+        max_stress_gear = result.stress_details.max_gear()
         
         # 应力比硬约束检查
         if cfg.strict_stress_ratio and result.stress_ratios:
@@ -300,12 +287,8 @@ class GearOptimizer:
         if result.gear_materials:
             # 混合材质：分别计算各齿轮重量
             weight_g = 0
-            gears = [
-                (d1, width1, 'z1'), (d2, width1, 'z2'),
-                (d3, width2, 'z3'), (d4, width2, 'z4')
-            ]
-            for d, width, gear_key in gears:
-                mat_key = result.gear_materials.get(gear_key, 'steel')
+            gears = [(d1, width1), (d2, width1), (d3, width2), (d4, width2)]
+            for (d, width), mat_key in zip(gears, result.gear_materials):
                 material = self.material_db.get(mat_key) or self.material_db['steel']
                 vol = math.pi * (d/2)**2 * width
                 weight_g += 0.5 * vol * material.density * 1000
@@ -338,14 +321,14 @@ class GearOptimizer:
             stress_details=result.stress_details,
             max_stress_gear=max_stress_gear,
             gear_materials=result.gear_materials,
-            gear_material_names=result.gear_material_names,
-            tip_relief_amounts=result.tip_relief_amounts,
+            gear_material_names=result.gear_material_names or {},
+            tip_relief_amounts=result.tip_relief_amounts or {},
             tip_relief1=cfg.tip_relief1,
             tip_relief2=cfg.tip_relief2,
             helix_angle1=cfg.helix_angle1,
             helix_angle2=cfg.helix_angle2,
-            contact_ratios=result.contact_ratios,
-            stress_ratios=result.stress_ratios,
+            contact_ratios=result.contact_ratios or {},
+            stress_ratios=result.stress_ratios or {},
             max_stress_ratio_gear=result.max_stress_ratio_gear
         )
     
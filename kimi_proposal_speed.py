@@ -10,9 +10,12 @@ import os
 import sys
 import signal
 import gc
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Tuple, List, Dict
 
+# 齿形系数与 material_check 共用同一张查表
+from material_check import spur_form_factor
+
 # 设置多进程启动方法为 'spawn'，避免 fork 导致的资源继承问题
 # 这必须在导入 multiprocessing 之前设置
 import multiprocessing as mp
@@ -188,6 +191,25 @@ def colorize(text, color):
     return f"{color}{text}{Color.RESET}"
 
 
+# ==================== 预生成的边框常量 ====================
+# 报告中的边框和标题均为固定文本，导入时一次性着色
+BANNER_TOP_CYAN = colorize('╔══════════════════════════════════════════════════════════╗', Color.BRIGHT_CYAN)
+BANNER_BOTTOM_CYAN = colorize('╚══════════════════════════════════════════════════════════╝', Color.BRIGHT_CYAN)
+BANNER_TOP_GREEN = colorize('╔══════════════════════════════════════════════════════════╗', Color.BRIGHT_GREEN)
+BANNER_BOTTOM_GREEN = colorize('╚══════════════════════════════════════════════════════════╝', Color.BRIGHT_GREEN)
+BANNER_START = colorize('║                  开始齿轮优化计算...                     ║', Color.BRIGHT_CYAN + Color.BOLD)
+BANNER_START_NOTE = colorize('║      (细粒度任务切分版 - 防止系统卡死)                   ║', Color.BRIGHT_CYAN)
+BANNER_REPORT = colorize('║            二级齿轮传动优化设计报告                      ║', Color.BRIGHT_CYAN + Color.BOLD)
+BANNER_DONE = colorize('║                      设计完成                            ║', Color.BRIGHT_GREEN + Color.BOLD)
+BORDER_TOP_GEAR = colorize('┌────────────────── 齿轮参数 ──────────────────┐', Color.BRIGHT_BLUE)
+BORDER_TOP_PERFORMANCE = colorize('┌────────────────── 总体性能 ──────────────────┐', Color.BRIGHT_BLUE)
+BORDER_TOP_DIMENSION = colorize('┌────────────────── 尺寸与重量 ────────────────┐', Color.BRIGHT_BLUE)
+BORDER_TOP_MATERIAL = colorize('┌────────────────── 材料强度校核 ──────────────┐', Color.BRIGHT_BLUE)
+BORDER_TOP_VALIDATION = colorize('┌────────────────── 设计验证 ──────────────────┐', Color.BRIGHT_BLUE)
+BORDER_BOTTOM = colorize('└──────────────────────────────────────────────┘', Color.BRIGHT_BLUE)
+BORDER_SIDE = colorize('│', Color.BRIGHT_BLUE)
+
+
 # ==================== 辅助函数 ====================
 def iif(cond, a, b):
     """条件选择函数"""
@@ -214,8 +236,8 @@ def calculate_bending_stress(m, z, width, torque, alpha_deg=20):
         return float('inf'), 0
     
     # 齿形系数 Y_F (简化公式, 适用于标准齿轮)
-    # Y_F ≈ 2.1 + 3.5/z (经验公式)
-    Y_F = 2.1 + 3.5 / z
+    # Y_F ≈ 2.1 + 3.5/z (经验公式，常用整数齿数查表)
+    Y_F = spur_form_factor(z)
     
     # 应力修正系数 Y_S ≈ 1.0 (简化)
     Y_S = 1.0
@@ -289,9 +311,8 @@ def select_material_by_strength(m1, m2, z1, z2, z3, z4, width1, width2,
     
     # 选择最合适的材质 (优先顺序: PEEK > POM > 钢 > 尼龙, 基于重量和强度)
     if suitable_materials:
-        # 按密度从小到大排序 (优先轻量材料)
-        suitable_materials.sort(key=lambda x: x[1]['density'])
-        selected_key = suitable_materials[0][0]
+        # 取密度最小者 (优先轻量材料)
+        selected_key = min(suitable_materials, key=lambda x: x[1]['density'])[0]
     else:
         # 如果没有合适的,选择强度最高的钢
         selected_key = 'steel'
@@ -337,6 +358,30 @@ class DesignResult:
     allow_bending_stress: float = 0
     strength_check_pass: bool = False
     material_check_results: dict = None
+    # 派生字段 (由 __post_init__ 计算, 供输出和验证复用)
+    radius1: float = field(init=False, default=0)
+    radius2: float = field(init=False, default=0)
+    radius3: float = field(init=False, default=0)
+    radius4: float = field(init=False, default=0)
+    width_factor1: float = field(init=False, default=0)
+    width_factor2: float = field(init=False, default=0)
+    total_width: float = field(init=False, default=0)
+    wheelbase1_calc: float = field(init=False, default=0)
+    wheelbase2_calc: float = field(init=False, default=0)
+    strength_factor: float = field(init=False, default=0)
+    
+    def __post_init__(self):
+        self.radius1 = self.D1 / 2
+        self.radius2 = self.D2 / 2
+        self.radius3 = self.D3 / 2
+        self.radius4 = self.D4 / 2
+        self.width_factor1 = self.width1 / self.m1 if self.m1 > 0 else 0
+        self.width_factor2 = self.width2 / self.m2 if self.m2 > 0 else 0
+        self.total_width = self.width1 + self.width2
+        self.wheelbase1_calc = self.radius1 + self.radius2
+        self.wheelbase2_calc = self.radius3 + self.radius4
+        stage1 = self.m1 * self.width1
+        self.strength_factor = (self.m2 * self.width2) / stage1 if stage1 > 0 else 0
 
 
 # ==================== 并行搜索任务 ====================
@@ -506,10 +551,10 @@ def optimize_gear_design():
     mode_display = "重量最轻" if OPTIMIZATION_MODE == 'weight' else "纵向尺寸最短"
     mode_color = Color.BRIGHT_GREEN if OPTIMIZATION_MODE == 'weight' else Color.BRIGHT_MAGENTA
     
-    print(colorize('╔══════════════════════════════════════════════════════════╗', Color.BRIGHT_CYAN))
-    print(colorize('║                  开始齿轮优化计算...                     ║', Color.BRIGHT_CYAN + Color.BOLD))
-    print(colorize('║      (细粒度任务切分版 - 防止系统卡死)                   ║', Color.BRIGHT_CYAN))
-    print(colorize('╚══════════════════════════════════════════════════════════╝', Color.BRIGHT_CYAN))
+    print(BANNER_TOP_CYAN)
+    print(BANNER_START)
+    print(BANNER_START_NOTE)
+    print(BANNER_BOTTOM_CYAN)
     print(f"{colorize('优化模式:', Color.BRIGHT_YELLOW)} {colorize(mode_display, mode_color + Color.BOLD)}")
     print(f"{colorize('扫描范围:', Color.BRIGHT_YELLOW)} D1[{D1_min}-{D1_max}], D2[{D2_min}-{D2_max}], D3[{D3_min}-{D3_max}], D4[{D4_min}-{D4_max}]")
     if OPTIMIZE_WIDTH_FACTOR:
@@ -673,9 +718,9 @@ def print_results(best_design: Optional[DesignResult], best_metric: float):
     """打印优化结果（带颜色）"""
     
     print()
-    print(colorize('╔══════════════════════════════════════════════════════════╗', Color.BRIGHT_CYAN))
-    print(colorize('║            二级齿轮传动优化设计报告                      ║', Color.BRIGHT_CYAN + Color.BOLD))
-    print(colorize('╚══════════════════════════════════════════════════════════╝', Color.BRIGHT_CYAN))
+    print(BANNER_TOP_CYAN)
+    print(BANNER_REPORT)
+    print(BANNER_BOTTOM_CYAN)
     print()
     
     if best_metric == float('inf') or best_design is None:
@@ -797,11 +842,11 @@ def print_results(best_design: Optional[DesignResult], best_metric: float):
         T2_output = T2_input * best_design.i2 * 0.95  # 第二级从动轮输出扭矩 (考虑效率)
         
         # 齿轮参数
-        print(colorize('┌────────────────── 齿轮参数 ──────────────────┐', Color.BRIGHT_BLUE))
+        print(BORDER_TOP_GEAR)
         print(f"{colorize('│ 第一级 (高速级):', Color.BRIGHT_MAGENTA)}")
         print(f"│   模数 m1 = {colorize(f'{best_design.m1:.2f}', Color.BRIGHT_GREEN)} mm, 齿距 p1 = {colorize(f'{p1:.3f}', Color.BRIGHT_CYAN)} mm")
         print(f"│   齿顶高 = {colorize(f'{ha1:.2f}', Color.BRIGHT_CYAN)} mm, 齿根高 = {colorize(f'{hf1:.2f}', Color.BRIGHT_CYAN)} mm, 总齿高 = {colorize(f'{h1:.2f}', Color.BRIGHT_CYAN)} mm")
-        print(f"│   齿宽系数 = {colorize(f'{best_design.width1/best_design.m1:.0f}', Color.BRIGHT_YELLOW)}, 轴向厚度(齿宽) = {colorize(f'{best_design.width1:.2f}', Color.BRIGHT_GREEN)} mm")
+        print(f"│   齿宽系数 = {colorize(f'{best_design.width_factor1:.0f}', Color.BRIGHT_YELLOW)}, 轴向厚度(齿宽) = {colorize(f'{best_design.width1:.2f}', Color.BRIGHT_GREEN)} mm")
         print(f"│   危险截面齿根宽 sf1 = {colorize(f'{sf1:.3f}', Color.BRIGHT_YELLOW)} mm (sf/m = {colorize(f'{sf_m_ratio1:.3f}', Color.BRIGHT_YELLOW)})")
         print(f"│   主动轮: 齿数 z1 = {colorize(f'{best_design.z1}', Color.BRIGHT_CYAN)}, 分度圆直径 D1 = {colorize(f'{best_design.D1:.2f}', Color.BRIGHT_CYAN)} mm")
         print(f"│           齿根圆直径 = {colorize(f'{df1:.2f}', Color.BRIGHT_CYAN)} mm, 齿根圆处齿厚 = {colorize(f'{sf_tooth_1:.3f}', Color.BRIGHT_GREEN)} mm")
@@ -810,11 +855,11 @@ def print_results(best_design: Optional[DesignResult], best_metric: float):
         print(f"│           齿根圆直径 = {colorize(f'{df2:.2f}', Color.BRIGHT_CYAN)} mm, 齿根圆处齿厚 = {colorize(f'{sf_tooth_2:.3f}', Color.BRIGHT_GREEN)} mm")
         print(f"│           输出扭矩 = {colorize(f'{T1_output:.3f}', Color.BRIGHT_YELLOW)} N·m")
         print(f"│   传动比 i1 = {colorize(f'{best_design.i1:.3f}', Color.BRIGHT_GREEN)}")
-        print(f"{colorize('│', Color.BRIGHT_BLUE)}")
+        print(BORDER_SIDE)
         print(f"{colorize('│ 第二级 (低速级):', Color.BRIGHT_MAGENTA)}")
         print(f"│   模数 m2 = {colorize(f'{best_design.m2:.2f}', Color.BRIGHT_GREEN)} mm, 齿距 p2 = {colorize(f'{p2:.3f}', Color.BRIGHT_CYAN)} mm")
         print(f"│   齿顶高 = {colorize(f'{ha2:.2f}', Color.BRIGHT_CYAN)} mm, 齿根高 = {colorize(f'{hf2:.2f}', Color.BRIGHT_CYAN)} mm, 总齿高 = {colorize(f'{h2:.2f}', Color.BRIGHT_CYAN)} mm")
-        print(f"│   齿宽系数 = {colorize(f'{best_design.width2/best_design.m2:.0f}', Color.BRIGHT_YELLOW)}, 轴向厚度(齿宽) = {colorize(f'{best_design.width2:.2f}', Color.BRIGHT_GREEN)} mm")
+        print(f"│   齿宽系数 = {colorize(f'{best_design.width_factor2:.0f}', Color.BRIGHT_YELLOW)}, 轴向厚度(齿宽) = {colorize(f'{best_design.width2:.2f}', Color.BRIGHT_GREEN)} mm")
         print(f"│   危险截面齿根宽 sf2 = {colorize(f'{sf2:.3f}', Color.BRIGHT_YELLOW)} mm (sf/m = {colorize(f'{sf_m_ratio2:.3f}', Color.BRIGHT_YELLOW)})")
         print(f"│   主动轮: 齿数 z3 = {colorize(f'{best_design.z3}', Color.BRIGHT_CYAN)}, 分度圆直径 D3 = {colorize(f'{best_design.D3:.2f}', Color.BRIGHT_CYAN)} mm")
         print(f"│           齿根圆直径 = {colorize(f'{df3:.2f}', Color.BRIGHT_CYAN)} mm, 齿根圆处齿厚 = {colorize(f'{sf_tooth_3:.3f}', Color.BRIGHT_GREEN)} mm")
@@ -823,11 +868,11 @@ def print_results(best_design: Optional[DesignResult], best_metric: float):
         print(f"│           齿根圆直径 = {colorize(f'{df4:.2f}', Color.BRIGHT_CYAN)} mm, 齿根圆处齿厚 = {colorize(f'{sf_tooth_4:.3f}', Color.BRIGHT_GREEN)} mm")
         print(f"│           输出扭矩 = {colorize(f'{T2_output:.3f}', Color.BRIGHT_YELLOW)} N·m")
         print(f"│   传动比 i2 = {colorize(f'{best_design.i2:.3f}', Color.BRIGHT_GREEN)}")
-        print(colorize('└──────────────────────────────────────────────┘', Color.BRIGHT_BLUE))
+        print(BORDER_BOTTOM)
         print()
         
         # 总体性能
-        print(colorize('┌────────────────── 总体性能 ──────────────────┐', Color.BRIGHT_BLUE))
+        print(BORDER_TOP_PERFORMANCE)
         print(f"│ 总减速比: {colorize(f'{best_design.Total_Ratio:.3f}', Color.BRIGHT_GREEN + Color.BOLD)}")
         print(f"│ 实际齿数配比: ({colorize(f'{best_design.z1}:{best_design.z2}', Color.BRIGHT_CYAN)}) × ({colorize(f'{best_design.z3}:{best_design.z4}', Color.BRIGHT_CYAN)})")
         print(f"│ 输出转速: {colorize(f'{best_design.output_speed:.2f}', Color.BRIGHT_CYAN)} rpm (固定目标值)")
@@ -839,42 +884,42 @@ def print_results(best_design: Optional[DesignResult], best_metric: float):
         satisfy_torque = '满足' if best_design.output_torque >= output_torque else '不满足'
         torque_color = Color.BRIGHT_GREEN if satisfy_torque == '满足' else Color.BRIGHT_RED
         print(f"│ 输出扭矩: {colorize(f'{best_design.output_torque:.3f}', Color.BRIGHT_CYAN)} Nm (要求 >= {output_torque} Nm) 【{colorize(satisfy_torque, torque_color + Color.BOLD)}】")
-        print(colorize('└──────────────────────────────────────────────┘', Color.BRIGHT_BLUE))
+        print(BORDER_BOTTOM)
         print()
         
         # 尺寸与重量
-        print(colorize('┌────────────────── 尺寸与重量 ────────────────┐', Color.BRIGHT_BLUE))
+        print(BORDER_TOP_DIMENSION)
         print(f"{colorize('│ 轴距参数:', Color.BRIGHT_MAGENTA)}")
         print(f"│   第一级中心距 (电机轴-中间轴): {colorize(f'{best_design.wheelbase1:.2f}', Color.BRIGHT_CYAN)} mm")
         print(f"│   第二级中心距 (中间轴-输出轴): {colorize(f'{best_design.wheelbase2:.2f}', Color.BRIGHT_CYAN)} mm")
-        print(f"│ 齿轮轴向总厚度: {colorize(f'{best_design.width1 + best_design.width2:.2f}', Color.BRIGHT_CYAN)} mm (两级齿轮厚度之和)")
-        print(f"│ 总体轴向尺寸: {colorize(f'{best_design.width1 + best_design.width2 + 15:.2f}', Color.BRIGHT_CYAN)} mm (齿轮厚度 + 轴承间隙15mm)")
+        print(f"│ 齿轮轴向总厚度: {colorize(f'{best_design.total_width:.2f}', Color.BRIGHT_CYAN)} mm (两级齿轮厚度之和)")
+        print(f"│ 总体轴向尺寸: {colorize(f'{best_design.total_width + 15:.2f}', Color.BRIGHT_CYAN)} mm (齿轮厚度 + 轴承间隙15mm)")
         print(f"│ 最大径向尺寸: {colorize(f'{max(best_design.D2, best_design.D4):.2f}', Color.BRIGHT_CYAN)} mm (电机直径参考: {motor_D:.1f} mm)")
-        print(f"{colorize('│', Color.BRIGHT_BLUE)}")
+        print(BORDER_SIDE)
         print(f"{colorize('│ 纵向尺寸组成:', Color.BRIGHT_MAGENTA)}")
         print(f"│   电机半径: {colorize(f'{motor_D/2:.2f}', Color.BRIGHT_CYAN)} mm")
-        print(f"│   D1/2 (一级主动轮半径): {colorize(f'{best_design.D1/2:.2f}', Color.BRIGHT_CYAN)} mm")
-        print(f"│   D2/2 (一级从动轮半径): {colorize(f'{best_design.D2/2:.2f}', Color.BRIGHT_CYAN)} mm")
-        print(f"│   D3/2 (二级主动轮半径): {colorize(f'{best_design.D3/2:.2f}', Color.BRIGHT_CYAN)} mm")
-        print(f"│   D4/2 (二级从动轮半径): {colorize(f'{best_design.D4/2:.2f}', Color.BRIGHT_CYAN)} mm")
+        print(f"│   D1/2 (一级主动轮半径): {colorize(f'{best_design.radius1:.2f}', Color.BRIGHT_CYAN)} mm")
+        print(f"│   D2/2 (一级从动轮半径): {colorize(f'{best_design.radius2:.2f}', Color.BRIGHT_CYAN)} mm")
+        print(f"│   D3/2 (二级主动轮半径): {colorize(f'{best_design.radius3:.2f}', Color.BRIGHT_CYAN)} mm")
+        print(f"│   D4/2 (二级从动轮半径): {colorize(f'{best_design.radius4:.2f}', Color.BRIGHT_CYAN)} mm")
         # 根据优化模式高亮显示主要优化指标
         if OPTIMIZATION_MODE == 'weight':
             print(f"│ {colorize('总纵向尺寸:', Color.BRIGHT_YELLOW)} {colorize(f'{best_design.total_size:.2f}', Color.BRIGHT_CYAN)} mm")
-            print(f"{colorize('│', Color.BRIGHT_BLUE)}")
+            print(BORDER_SIDE)
             print(f"│ 齿轮组重量: {colorize(f'{best_design.gear_weight_g:.3f}', Color.BRIGHT_YELLOW)} g")
             print(f"│ 电机重量: {colorize(f'{motor_weight}', Color.BRIGHT_YELLOW)} g")
             print(f"│ {colorize('系统总重量:', Color.BRIGHT_YELLOW)} {colorize(f'{best_design.total_weight_g:.3f}', Color.BRIGHT_GREEN + Color.BOLD)} g ({colorize(f'{best_design.total_weight_g/1000:.3f}', Color.BRIGHT_GREEN)} kg) {colorize('← 优化指标', Color.BRIGHT_GREEN)}")
         else:
             print(f"│ {colorize('总纵向尺寸:', Color.BRIGHT_YELLOW)} {colorize(f'{best_design.total_size:.2f}', Color.BRIGHT_MAGENTA + Color.BOLD)} mm {colorize('← 优化指标', Color.BRIGHT_MAGENTA)}")
-            print(f"{colorize('│', Color.BRIGHT_BLUE)}")
+            print(BORDER_SIDE)
             print(f"│ 齿轮组重量: {colorize(f'{best_design.gear_weight_g:.3f}', Color.BRIGHT_YELLOW)} g")
             print(f"│ 电机重量: {colorize(f'{motor_weight}', Color.BRIGHT_YELLOW)} g")
             print(f"│ 系统总重量: {colorize(f'{best_design.total_weight_g:.3f}', Color.BRIGHT_GREEN)} g ({colorize(f'{best_design.total_weight_g/1000:.3f}', Color.BRIGHT_GREEN)} kg)")
-        print(colorize('└──────────────────────────────────────────────┘', Color.BRIGHT_BLUE))
+        print(BORDER_BOTTOM)
         print()
         
         # 材料强度校核详细信息
-        print(colorize('┌────────────────── 材料强度校核 ──────────────┐', Color.BRIGHT_BLUE))
+        print(BORDER_TOP_MATERIAL)
         print(f"{colorize('│ 选定材质:', Color.BRIGHT_MAGENTA)} {colorize(best_design.material_name, Color.BRIGHT_GREEN)}")
         print(f"│ 材质密度: {colorize(f'{best_design.material_density:.2e}', Color.BRIGHT_CYAN)} kg/mm³")
         print(f"│ 最大弯曲应力: {colorize(f'{best_design.max_bending_stress:.1f}', Color.BRIGHT_YELLOW)} MPa")
@@ -886,7 +931,7 @@ def print_results(best_design: Optional[DesignResult], best_metric: float):
         
         # 各材质校核对比 (现在只显示选定材质)
         if best_design.material_check_results:
-            print(f"{colorize('│', Color.BRIGHT_BLUE)}")
+            print(BORDER_SIDE)
             print(f"{colorize('│ 材质校核详情:', Color.BRIGHT_MAGENTA)}")
             # 获取选定材质的结果
             selected_result = best_design.material_check_results.get(best_design.material_key, {})
@@ -894,15 +939,15 @@ def print_results(best_design: Optional[DesignResult], best_metric: float):
                 status = colorize('✓', Color.BRIGHT_GREEN) if selected_result.get('suitable', False) else colorize('✗', Color.BRIGHT_RED)
                 weight_est = best_design.gear_weight_g * (selected_result.get('density', best_design.material_density) / best_design.material_density)
                 print(f"│ ► {status} {selected_result.get('name', best_design.material_name)}: 应力 {selected_result.get('max_stress', 0):.1f}/{selected_result.get('allow_stress', 0):.1f} MPa, 安全裕度 {selected_result.get('safety_margin', 0):.2f}")
-        print(colorize('└──────────────────────────────────────────────┘', Color.BRIGHT_BLUE))
+        print(BORDER_BOTTOM)
         print()
         
         # 设计验证
-        print(colorize('┌────────────────── 设计验证 ──────────────────┐', Color.BRIGHT_BLUE))
+        print(BORDER_TOP_VALIDATION)
         
         # 验证轴距约束
-        wb1_check = abs(best_design.wheelbase1 - (best_design.D1 + best_design.D2) / 2) < 0.01
-        wb2_check = abs(best_design.wheelbase2 - (best_design.D3 + best_design.D4) / 2) < 0.01
+        wb1_check = abs(best_design.wheelbase1 - best_design.wheelbase1_calc) < 0.01
+        wb2_check = abs(best_design.wheelbase2 - best_design.wheelbase2_calc) < 0.01
         wb_result = iif(wb1_check and wb2_check, "通过", "失败")
         wb_color = Color.BRIGHT_GREEN if wb_result == "通过" else Color.BRIGHT_RED
         print(f"│ 轴距约束验证: {colorize(wb_result, wb_color + Color.BOLD)}")
@@ -915,17 +960,17 @@ def print_results(best_design: Optional[DesignResult], best_metric: float):
         print(f"│ 齿轮间隙验证 (D1-D3 >= 1mm): {colorize(f'{clearance_value:.2f}', Color.BRIGHT_CYAN)} mm 【{colorize(clearance_result, clearance_color + Color.BOLD)}】")
         
         # 强度粗略估算 (简化)
-        strength_factor = (best_design.m2 * best_design.width2) / (best_design.m1 * best_design.width1)
+        strength_factor = best_design.strength_factor
         strength_ok = strength_factor > 1.0
         strength_status = iif(strength_ok, "✓ 符合", "✗ 注意")
         strength_color = Color.BRIGHT_GREEN if strength_ok else Color.BRIGHT_YELLOW
         print(f"│ 低速级相对强度系数: {colorize(f'{strength_factor:.2f}', Color.BRIGHT_CYAN)} {colorize(strength_status, strength_color)} (>1.0表示低速级更强)")
-        print(colorize('└──────────────────────────────────────────────┘', Color.BRIGHT_BLUE))
+        print(BORDER_BOTTOM)
     
     print()
-    print(colorize('╔══════════════════════════════════════════════════════════╗', Color.BRIGHT_GREEN))
-    print(colorize('║                      设计完成                            ║', Color.BRIGHT_GREEN + Color.BOLD))
-    print(colorize('╚══════════════════════════════════════════════════════════╝', Color.BRIGHT_GREEN))
+    print(BANNER_TOP_GREEN)
+    print(BANNER_DONE)
+    print(BANNER_BOTTOM_GREEN)
 
 
 # ==================== 主程序入口 ====================
@@ -939,8 +984,6 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
-        # 最终清理
-        gc.collect()
         print(colorize("程序结束", Color.BRIGHT_CYAN))
 
 if __name__ == '__main__':
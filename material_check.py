@@ -5,11 +5,113 @@
 """
 
 import math
-from typing import Dict, Tuple, List, Optional
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Iterable, NamedTuple
+from dataclasses import dataclass, field
 
 
-@dataclass
+# 齿形系数查表 Y_F = 2.1 + 3.5/z，下标为齿数 (z < 12 不使用)
+Y_F_TABLE = tuple(0.0 if z < 12 else 2.1 + 3.5 / z for z in range(200))
+
+
+def spur_form_factor(z: int) -> float:
+    """直齿轮齿形系数 Y_F ≈ 2.1 + 3.5/z（常用整数齿数查表）"""
+    if isinstance(z, int) and z < len(Y_F_TABLE):
+        return Y_F_TABLE[z]
+    return 2.1 + 3.5 / z
+
+# 各齿轮描述
+_GEAR_DESCS = {'z1': '一级主动', 'z2': '一级从动', 'z3': '二级主动', 'z4': '二级从动'}
+
+# 各齿轮描述标签（按 z1-z4 顺序，用于显示），如 'z1(一级主动)'
+GEAR_LABELS = tuple(f'{key}({desc})' for key, desc in _GEAR_DESCS.items())
+
+
+class GearStresses(NamedTuple):
+    """各齿轮弯曲应力 (MPa)，按 z1-z4 顺序"""
+    z1: float
+    z2: float
+    z3: float
+    z4: float
+    
+    def as_dict(self) -> Dict[str, float]:
+        """生成以齿轮描述为键的应力字典（供显示使用）"""
+        return dict(zip(GEAR_LABELS, self))
+    
+    def max_gear(self) -> str:
+        """最大应力所在齿轮的描述"""
+        return GEAR_LABELS[self.index(max(self))]
+
+
+class GearMaterials(NamedTuple):
+    """各齿轮材质键名，按 z1-z4 顺序"""
+    z1: str
+    z2: str
+    z3: str
+    z4: str
+
+
+# 齿根厚系数缓存 {压力角(度): sf/m}，各校核器共享
+_SF_FACTOR_CACHE: Dict[float, float] = {}
+
+
+def sf_factor_for(pressure_angle: float) -> float:
+    """
+    计算危险截面齿根厚系数 sf/m（按压力角缓存）
+    
+    Args:
+        pressure_angle: 压力角（度）
+        
+    Returns:
+        齿根厚与模数之比
+    """
+    value = _SF_FACTOR_CACHE.get(pressure_angle)
+    if value is None:
+        alpha = math.radians(pressure_angle)
+        value = math.pi / 2 * math.cos(alpha) - 2 * 1.25 * math.tan(alpha)
+        _SF_FACTOR_CACHE[pressure_angle] = value
+    return value
+
+
+@lru_cache(maxsize=64)
+def _cos_cubed(helix_angle: float) -> float:
+    """螺旋角余弦的三次方 cos³β（斜齿轮当量齿数用，按螺旋角缓存）"""
+    return math.cos(math.radians(helix_angle)) ** 3
+
+
+def _root_bending_stress(
+    m: float,
+    z: int,
+    width: float,
+    torque: float,
+    Y_F: float,
+    Y_S: float = 1.0,
+    Y_epsilon: float = 0.7,
+    K_v: float = 1.0,
+    K_beta: float = 1.0
+) -> float:
+    """
+    齿根弯曲应力公式 (MPa)，各校核路径共用的唯一实现
+    
+    σ_F = (2 * T * Y_F * Y_S * Y_ε * K_v * K_β) / (b * m² * z)，扭矩 T 由 N·m 转 N·mm。
+    不做参数有效性检查，由调用方负责。
+    """
+    return (2 * (torque * 1000) * Y_F * Y_S * Y_epsilon * K_v * K_beta) / (width * (m * m) * z)
+
+
+def _spur_bending_stress(m: float, z: int, width: float, torque: float) -> float:
+    """
+    直齿轮齿根弯曲应力 (MPa) 的扫描热路径版本
+    
+    等价于 StrengthChecker.calculate_bending_stress 的默认系数
+    (Y_S=1.0, Y_ε=0.7, 不修缘, 直齿轮)，只返回应力，省去方法调用和元组打包
+    """
+    if z < 12 or width <= 0 or m <= 0:
+        return float('inf')
+    return _root_bending_stress(m, z, width, torque, spur_form_factor(z))
+
+
+@dataclass(frozen=True, slots=True)
 class Material:
     """材料数据类"""
     name: str
@@ -18,9 +120,13 @@ class Material:
     sf_min_ratio: float  # 最小齿根厚/模数比
     safety_factor: float
     color: str = ''
+    allow_stress: float = field(init=False, repr=False, compare=False)  # 许用弯曲应力 (MPa)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'allow_stress', self.sigma_f / self.safety_factor)
 
 
-@dataclass
+@dataclass(slots=True)
 class MaterialCheckResult:
     """材料校核结果"""
     material_key: str
@@ -32,33 +138,30 @@ class MaterialCheckResult:
     suitable: bool
     safety_margin: float
     density: float
-    # 各齿轮应力详情 (齿轮编号, 应力值MPa)
-    stress_details: Dict[str, float] = None
+    # 各齿轮应力详情 (MPa)，未生成时为 None
+    stress_details: Optional[GearStresses] = None
+    # 以下为混合材质校核的详细信息，单一材质校核时为 None（不分配空字典）
     # 混合材质配置 - 各齿轮实际使用的材质
-    gear_materials: Dict[str, str] = None  # 如 {'z1': 'steel', 'z2': 'peek', ...}
-    gear_material_names: Dict[str, str] = None  # 如 {'z1': '合金钢', 'z2': 'PEEK', ...}
+    gear_materials: Optional[GearMaterials] = None  # 如 GearMaterials('steel', 'peek', ...)
+    gear_material_names: Optional[Dict[str, str]] = None  # 如 {'z1': '合金钢', 'z2': 'PEEK', ...}
     # 齿顶修缘量 (mm)
-    tip_relief_amounts: Dict[str, float] = None  # 如 {'z1': 0.016, 'z2': 0.016, ...}
+    tip_relief_amounts: Optional[Dict[str, float]] = None  # 如 {'z1': 0.016, 'z2': 0.016, ...}
     # 重合度
-    contact_ratios: Dict[str, float] = None  # 如 {'stage1': 2.5, 'stage2': 1.8}
+    contact_ratios: Optional[Dict[str, float]] = None  # 如 {'stage1': 2.5, 'stage2': 1.8}
     # 各齿轮应力比 (应力/许用应力)
-    stress_ratios: Dict[str, float] = None  # 如 {'z1': 0.45, 'z2': 0.52, ...}
+    stress_ratios: Optional[Dict[str, float]] = None  # 如 {'z1(一级主动)': 0.45, ...}
     # 最大应力比所在齿轮
     max_stress_ratio_gear: str = ""  # 如 'z3(二级主动)'
     
-    def __post_init__(self):
-        if self.stress_details is None:
-            self.stress_details = {}
-        if self.gear_materials is None:
-            self.gear_materials = {}
-        if self.gear_material_names is None:
-            self.gear_material_names = {}
-        if self.tip_relief_amounts is None:
-            self.tip_relief_amounts = {}
-        if self.contact_ratios is None:
-            self.contact_ratios = {}
-        if self.stress_ratios is None:
-            self.stress_ratios = {}
+    @property
+    def stress_details_as_dict(self) -> Dict[str, float]:
+        """以齿轮描述为键的应力详情字典，如 {'z1(一级主动)': 120.5, ...}"""
+        return self.stress_details.as_dict() if self.stress_details else {}
+    
+    @property
+    def gear_materials_as_dict(self) -> Dict[str, str]:
+        """以齿轮编号为键的材质字典，如 {'z1': 'steel', 'z2': 'peek', ...}"""
+        return self.gear_materials._asdict() if self.gear_materials else {}
 
 
 class MaterialDatabase:
@@ -121,6 +224,9 @@ class MaterialDatabase:
             materials: 自定义材料字典，默认使用内置材料
         """
         self.materials = materials or self.DEFAULT_MATERIALS.copy()
+        self._keys = None         # 缓存键名
+        self._sorted_keys = None  # 缓存按密度排序的键名
+        self._columns = None      # 缓存按密度排序的材料参数列
     
     def get(self, key: str) -> Optional[Material]:
         """获取材料"""
@@ -129,10 +235,40 @@ class MaterialDatabase:
     def add(self, key: str, material: Material) -> None:
         """添加新材料"""
         self.materials[key] = material
+        self._keys = None
+        self._sorted_keys = None
+        self._columns = None
     
-    def keys(self) -> List[str]:
-        """获取所有材料键名"""
-        return list(self.materials.keys())
+    def keys(self) -> Tuple[str, ...]:
+        """获取所有材料键名（缓存）"""
+        if self._keys is None:
+            self._keys = tuple(self.materials)
+        return self._keys
+    
+    def sorted_keys(self) -> Tuple[str, ...]:
+        """获取按密度从小到大排序的材料键名（缓存）"""
+        if self._sorted_keys is None:
+            self._sorted_keys = tuple(sorted(
+                self.materials, key=lambda k: self.materials[k].density
+            ))
+        return self._sorted_keys
+    
+    def columns(self) -> Tuple[Tuple[str, ...], Tuple[float, ...], Tuple[float, ...]]:
+        """
+        获取按密度从小到大排序的材料参数列（缓存）
+        
+        Returns:
+            (keys, allow_stresses, sf_min_ratios): 键名、许用应力(MPa)、最小齿根厚比
+        """
+        if self._columns is None:
+            keys = self.sorted_keys()
+            materials = [self.materials[k] for k in keys]
+            self._columns = (
+                keys,
+                tuple(m.allow_stress for m in materials),
+                tuple(m.sf_min_ratio for m in materials),
+            )
+        return self._columns
     
     def __contains__(self, key: str) -> bool:
         """检查是否包含某材料"""
@@ -154,15 +290,11 @@ class StrengthChecker:
             pressure_angle: 压力角（度），默认20度
         """
         self.pressure_angle = pressure_angle
-        self._sf_factor = None  # 缓存齿根厚系数
     
     @property
     def sf_factor(self) -> float:
-        """齿根厚系数（缓存）"""
-        if self._sf_factor is None:
-            alpha = math.radians(self.pressure_angle)
-            self._sf_factor = math.pi / 2 * math.cos(alpha) - 2 * 1.25 * math.tan(alpha)
-        return self._sf_factor
+        """齿根厚系数（按压力角在模块级缓存）"""
+        return sf_factor_for(self.pressure_angle)
     
     def calculate_contact_ratio(
         self,
@@ -187,36 +319,20 @@ class StrengthChecker:
             (epsilon_alpha, epsilon_beta, epsilon_gamma): 
             端面重合度、轴向重合度、总重合度
         """
-        alpha_t = math.radians(pressure_angle)
-        beta = math.radians(helix_angle)
-        
-        # 端面压力角
-        if beta > 0:
-            alpha_t = math.atan(math.tan(alpha_t) / math.cos(beta))
-        
-        # 端面重合度 (直齿轮部分)
-        # 简化计算
-        ra1 = m * (z1/2 + ha_coef)  # 齿顶圆半径
-        ra2 = m * (z2/2 + ha_coef)
-        r1 = m * z1 / 2  # 分度圆半径
-        r2 = m * z2 / 2
-        rb1 = r1 * math.cos(alpha_t)  # 基圆半径
-        rb2 = r2 * math.cos(alpha_t)
+        # 端面重合度近似公式（只与齿数有关，压力角和齿顶高按标准值取）
+        epsilon_alpha = 1.88 - 3.2 * (1/z1 + 1/z2)
         
-        # 啮合线长度
-        pb = math.pi * m * math.cos(alpha_t)  # 基圆齿距
+        # 直齿轮：无轴向重合度
+        if helix_angle <= 0:
+            return epsilon_alpha, 0.0, epsilon_alpha
         
-        # 端面重合度近似公式
-        epsilon_alpha = 1.88 - 3.2 * (1/z1 + 1/z2)
-        if beta > 0:  # 斜齿轮修正
-            epsilon_alpha *= math.cos(beta)
+        # 斜齿轮修正
+        beta = math.radians(helix_angle)
+        epsilon_alpha *= math.cos(beta)
         
-        # 轴向重合度 (仅斜齿轮)
-        epsilon_beta = 0.0
-        if beta > 0:
-            # 假设齿宽 b = 10 * m (标准齿宽系数)
-            b = 10 * m
-            epsilon_beta = b * math.sin(beta) / (math.pi * m)
+        # 轴向重合度，假设齿宽 b = 10 * m (标准齿宽系数)
+        b = 10 * m
+        epsilon_beta = b * math.sin(beta) / (math.pi * m)
         
         # 总重合度
         epsilon_gamma = epsilon_alpha + epsilon_beta
@@ -255,16 +371,30 @@ class StrengthChecker:
         if z < 12 or width <= 0 or m <= 0:
             return float('inf'), 0.0, 1.0, 1.0
         
-        # 齿形系数（经验公式，斜齿轮用当量齿数）
-        zv = z
+        Y_F = self._form_factor(z, helix_angle)
+        K_v, K_beta = self._load_factors(tip_relief, helix_angle)
+        
+        sigma_F = _root_bending_stress(m, z, width, torque, Y_F, Y_S, Y_epsilon, K_v, K_beta)
+        
+        return sigma_F, Y_F, K_v, K_beta
+    
+    @staticmethod
+    def _form_factor(z: int, helix_angle: float) -> float:
+        """齿形系数 Y_F（经验公式，斜齿轮用当量齿数，常用整数齿数查表）"""
         if helix_angle > 0:
             # 斜齿轮当量齿数
-            zv = z / (math.cos(math.radians(helix_angle)) ** 3)
-        Y_F = 2.1 + 3.5 / zv
-        
-        # 扭矩转 N·mm
-        T = torque * 1000
+            zv = z / _cos_cubed(helix_angle)
+            return 2.1 + 3.5 / zv
+        return spur_form_factor(z)
+    
+    @staticmethod
+    def _load_factors(tip_relief: float, helix_angle: float) -> Tuple[float, float]:
+        """
+        载荷系数
         
+        Returns:
+            (K_v, K_beta): 动载系数、斜齿轮系数
+        """
         # 动载系数（修缘降低冲击）
         K_v = max(0.85, 1.0 - 2.0 * tip_relief)
         
@@ -275,10 +405,7 @@ class StrengthChecker:
             K_beta = 0.85 + 0.01 * helix_angle  # 近似公式
             K_beta = min(K_beta, 0.95)  # 最多降低5%
         
-        # 弯曲应力
-        sigma_F = (2 * T * Y_F * Y_S * Y_epsilon * K_v * K_beta) / (width * m**2 * z)
-        
-        return sigma_F, Y_F, K_v, K_beta
+        return K_v, K_beta
     
     def calculate_tip_relief(self, m: float, tip_relief_coef: float) -> float:
         """
@@ -302,7 +429,8 @@ class StrengthChecker:
         width1: float,
         width2: float,
         torque1: float,
-        torque2: float
+        torque2: float,
+        include_details: bool = True
     ) -> MaterialCheckResult:
         """
         校核单个材料是否满足强度要求
@@ -314,37 +442,55 @@ class StrengthChecker:
             width1, width2: 第一/二级齿宽
             torque1: 第一级输入扭矩 (N·m)
             torque2: 第二级输入扭矩 (N·m)
+            include_details: 是否生成各齿轮应力详情，False时结果的 stress_details 为 None
             
         Returns:
             MaterialCheckResult: 校核结果
         """
-        # 计算各级弯曲应力
-        sigma_F1, _ = self.calculate_bending_stress(m1, z1, width1, torque1)
-        sigma_F2, _ = self.calculate_bending_stress(m1, z2, width1, torque1 * z2 / z1)
-        sigma_F3, _ = self.calculate_bending_stress(m2, z3, width2, torque2)
-        sigma_F4, _ = self.calculate_bending_stress(m2, z4, width2, torque2 * z4 / z3)
-        
-        # 应力详情
-        stress_details = {
-            'z1(一级主动)': sigma_F1,
-            'z2(一级从动)': sigma_F2,
-            'z3(二级主动)': sigma_F3,
-            'z4(二级从动)': sigma_F4
-        }
-        
-        # 最大弯曲应力
+        max_sigma_F, stress_details = self._compute_stresses(
+            m1, m2, z1, z2, z3, z4, width1, width2, torque1, torque2,
+            include_details
+        )
+        return self._check_against(material, max_sigma_F, stress_details)
+    
+    def _compute_stresses(
+        self,
+        m1: float,
+        m2: float,
+        z1: int, z2: int, z3: int, z4: int,
+        width1: float,
+        width2: float,
+        torque1: float,
+        torque2: float,
+        include_details: bool = True
+    ) -> Tuple[float, Optional[GearStresses]]:
+        """
+        计算与材料无关的弯曲应力部分
+        
+        Returns:
+            (max_sigma_F, stress_details): 最大弯曲应力(MPa)和各齿轮应力详情
+            (include_details=False 时应力详情为 None)
+        """
+        sigma_F1, sigma_F2, sigma_F3, sigma_F4 = self._gear_bending_stresses(
+            m1, m2, z1, z2, z3, z4, width1, width2, torque1, torque2
+        )
         max_sigma_F = max(sigma_F1, sigma_F2, sigma_F3, sigma_F4)
+        if not include_details:
+            return max_sigma_F, None
+        return max_sigma_F, GearStresses(sigma_F1, sigma_F2, sigma_F3, sigma_F4)
+    
+    def _check_against(
+        self,
+        material: Material,
+        max_sigma_F: float,
+        stress_details: Optional[GearStresses]
+    ) -> MaterialCheckResult:
+        """用已算好的应力校核单个材料（stress_details 在各材料结果间共享）"""
+        # 齿根厚检查：sf = m * sf_factor，故 sf/m 与模数无关，两级相同
+        sf_ratio_ok = self.sf_factor >= material.sf_min_ratio
         
         # 许用弯曲应力
-        sigma_F_allow = material.sigma_f / material.safety_factor
-        
-        # 齿根厚检查
-        sf1 = m1 * self.sf_factor
-        sf2 = m2 * self.sf_factor
-        sf_ratio_ok = (
-            (sf1 / m1 >= material.sf_min_ratio) and 
-            (sf2 / m2 >= material.sf_min_ratio)
-        )
+        sigma_F_allow = material.allow_stress
         
         # 强度检查
         strength_ok = max_sigma_F <= sigma_F_allow
@@ -378,7 +524,8 @@ class StrengthChecker:
         width2: float,
         torque1: float,
         torque2: float,
-        mode: str = 'auto'
+        mode: str = 'auto',
+        full_results: bool = False
     ) -> Tuple[str, Dict[str, MaterialCheckResult]]:
         """
         选择最优材料
@@ -390,40 +537,109 @@ class StrengthChecker:
             width1, width2: 齿宽
             torque1, torque2: 扭矩 (N·m)
             mode: 'auto'自动选择，或指定材料键名
+            full_results: 'auto'模式下是否校核全部材料，
+                默认False，按密度顺序找到首个满足的材料即停止
             
         Returns:
-            (selected_key, results_dict): 选中材料的键名和所有校核结果
+            (selected_key, results_dict): 选中材料的键名和校核结果
+            (指定材料模式下只包含该材料，'auto'模式下默认只包含选中材料)
         """
         results = {}
-        suitable_materials = []
-        
-        # 校核所有材料
-        for key in db.keys():
-            material = db[key]
-            result = self.check_material(
-                material, m1, m2, z1, z2, z3, z4,
-                width1, width2, torque1, torque2
-            )
-            result.material_key = key
-            results[key] = result
-            
-            if result.suitable:
-                suitable_materials.append((key, result))
+        args = (m1, m2, z1, z2, z3, z4, width1, width2, torque1, torque2)
         
-        # 指定材料模式
+        # 指定材料模式：只校核该材料
         if mode != 'auto':
-            return mode, results
+            return mode, {mode: self._check_key(db, mode, *self._compute_stresses(*args))}
+        
+        # 自动选择
+        selected_key, result = self._select_auto(db, *args)
+        results[selected_key] = result
         
-        # 自动选择：按密度排序，优先轻量材料
-        if suitable_materials:
-            suitable_materials.sort(key=lambda x: x[1].density)
-            selected_key = suitable_materials[0][0]
-        else:
-            # 没有材料满足，选强度最高的钢
-            selected_key = 'steel'
+        if full_results:
+            stresses = result.max_stress, result.stress_details
+            for key in db.keys():
+                if key not in results:
+                    results[key] = self._check_key(db, key, *stresses)
         
         return selected_key, results
     
+    def _select_auto(
+        self,
+        db: MaterialDatabase,
+        m1: float,
+        m2: float,
+        *args
+    ) -> Tuple[str, MaterialCheckResult]:
+        """
+        'auto'模式选材：按密度从小到大比对各材料参数列，首个满足即为最轻材料
+        
+        齿根厚不满足的材料预先排除（与模数无关）；应力与材料无关，只计算一次。
+        没有材料满足时，选强度最高的钢。
+        """
+        stresses = self._gear_bending_stresses(m1, m2, *args)
+        max_sigma_F = max(stresses)
+        selected_key = 'steel'
+        for key, allow_stress in self._sf_eligible(db.columns()):
+            if max_sigma_F <= allow_stress:
+                selected_key = key
+                break
+        # 比对过程只用最大应力，应力详情只为选中材料生成一次
+        stress_details = GearStresses._make(stresses)
+        return selected_key, self._check_key(db, selected_key, max_sigma_F, stress_details)
+    
+    def _sf_eligible(
+        self,
+        columns: Tuple[Tuple[str, ...], Tuple[float, ...], Tuple[float, ...]]
+    ) -> Tuple[Tuple[str, float], ...]:
+        """
+        齿根厚满足要求的材料，按密度从小到大
+        
+        sf/m 即 sf_factor，与模数、齿数、扭矩无关；每次按当前压力角重新筛选
+        （材料只有几种，且 pressure_angle 可在校核器创建后修改）
+        
+        Returns:
+            ((key, allow_stress), ...): 键名和许用应力(MPa)
+        """
+        sf_ratio = self.sf_factor
+        return tuple(
+            (key, allow_stress)
+            for key, allow_stress, sf_min_ratio in zip(*columns)
+            if sf_ratio >= sf_min_ratio
+        )
+    
+    def _gear_bending_stresses(
+        self,
+        m1: float,
+        m2: float,
+        z1: int, z2: int, z3: int, z4: int,
+        width1: float,
+        width2: float,
+        torque1: float,
+        torque2: float
+    ) -> Tuple[float, float, float, float]:
+        """计算四个齿轮的弯曲应力 (MPa)，与材料无关"""
+        i1 = z2 / z1
+        i2 = z4 / z3
+        
+        return (
+            _spur_bending_stress(m1, z1, width1, torque1),
+            _spur_bending_stress(m1, z2, width1, torque1 * i1),
+            _spur_bending_stress(m2, z3, width2, torque2),
+            _spur_bending_stress(m2, z4, width2, torque2 * i2),
+        )
+    
+    def _check_key(
+        self,
+        db: MaterialDatabase,
+        key: str,
+        max_sigma_F: float,
+        stress_details: Optional[GearStresses]
+    ) -> MaterialCheckResult:
+        """用已算好的应力校核数据库中指定键名的材料，并记录键名"""
+        result = self._check_against(db[key], max_sigma_F, stress_details)
+        result.material_key = key
+        return result
+    
     def check_mixed_materials(
         self,
         db: MaterialDatabase,
@@ -438,7 +654,8 @@ class StrengthChecker:
         tip_relief1: float = 0.0,
         tip_relief2: float = 0.0,
         helix_angle1: float = 0.0,
-        helix_angle2: float = 0.0
+        helix_angle2: float = 0.0,
+        include_contact_ratio: bool = True
     ) -> MaterialCheckResult:
         """
         混合材质校核 - 各齿轮可使用不同材质
@@ -455,72 +672,97 @@ class StrengthChecker:
             tip_relief2: 第二级齿顶修缘系数
             helix_angle1: 第一级螺旋角 (度)，0表示直齿轮
             helix_angle2: 第二级螺旋角 (度)，0表示直齿轮
+            include_contact_ratio: 是否计算重合度（仅用于报告），False时结果的 contact_ratios 为 None
             
         Returns:
             MaterialCheckResult: 校核结果（综合各材质情况）
         """
         # 计算各齿轮扭矩
         T1 = torque1
-        T2 = torque1 * z2 / z1  # z2承受的扭矩
+        T2 = torque1 * (z2 / z1)  # z2承受的扭矩
         T3 = torque2
-        T4 = torque2 * z4 / z3  # z4承受的扭矩
+        T4 = torque2 * (z4 / z3)  # z4承受的扭矩
+        
+        # 齿根厚/模数比 (sf = m * sf_factor，与模数无关)
+        sf_ratio = self.sf_factor
+        
+        # 计算各齿轮应力（考虑修缘和螺旋角，各级系数只算一次）
+        sigma_F1, sigma_F2 = self._stage_bending_stresses(
+            m1, z1, z2, width1, T1, T2, tip_relief1, helix_angle1
+        )
+        sigma_F3, sigma_F4 = self._stage_bending_stresses(
+            m2, z3, z4, width2, T3, T4, tip_relief2, helix_angle2
+        )
+        
+        # 各级修缘量
+        relief1 = self.calculate_tip_relief(m1, tip_relief1)
+        relief2 = self.calculate_tip_relief(m2, tip_relief2)
         
-        # 各齿轮参数 (增加修缘和螺旋角参数)
+        # 各齿轮参数
         gears = [
-            ('z1', m1, z1, width1, T1, tip_relief1, helix_angle1),
-            ('z2', m1, z2, width1, T2, tip_relief1, helix_angle1),
-            ('z3', m2, z3, width2, T3, tip_relief2, helix_angle2),
-            ('z4', m2, z4, width2, T4, tip_relief2, helix_angle2)
+            ('z1', m1, z1, width1, sigma_F1, relief1),
+            ('z2', m1, z2, width1, sigma_F2, relief1),
+            ('z3', m2, z3, width2, sigma_F3, relief2),
+            ('z4', m2, z4, width2, sigma_F4, relief2)
         ]
         
-        # 计算各齿轮应力和校核
-        stress_details = {}
-        gear_materials = {}
+        # 各齿轮校核
+        gear_mat_keys = []
         gear_material_names = {}
         all_suitable = True
         max_stress_ratio = 0
         max_stress_ratio_gear = ""
+        max_sigma_F = float('-inf')
+        ref_allow_stress = 0.0  # 最大应力齿轮的许用应力
         total_density_weighted = 0
+        total_volume = 0
         relief_amounts = {}  # 记录修缘量
         stress_ratios = {}  # 记录各齿轮应力比
         
         # 计算重合度（用于报告）
-        _, _, epsilon_gamma1 = self.calculate_contact_ratio(m1, z1, z2, helix_angle=helix_angle1)
-        _, _, epsilon_gamma2 = self.calculate_contact_ratio(m2, z3, z4, helix_angle=helix_angle2)
-        
-        for gear_key, m, z, width, torque, tip_relief, helix_angle in gears:
+        contact_ratios = None
+        if include_contact_ratio:
+            _, _, epsilon_gamma1 = self.calculate_contact_ratio(m1, z1, z2, helix_angle=helix_angle1)
+            _, _, epsilon_gamma2 = self.calculate_contact_ratio(m2, z3, z4, helix_angle=helix_angle2)
+            contact_ratios = {'stage1': epsilon_gamma1, 'stage2': epsilon_gamma2}
+        
+        # 循环内的查找方法预先绑定为局部变量
+        get_mat_key = material_config.get
+        get_material = db.materials.get
+        add_mat_key = gear_mat_keys.append
+        
+        for gear_desc, gear in zip(GEAR_LABELS, gears):
+            gear_key, m, z, width, sigma_F, relief = gear
+            
             # 获取该齿轮的材质
-            mat_key = material_config.get(gear_key, 'steel')
-            material = db.get(mat_key)
+            mat_key = get_mat_key(gear_key, 'steel')
+            material = get_material(mat_key)
             if material is None:
                 material = db['steel']  # 默认用钢
             
-            # 计算应力（考虑修缘和螺旋角）
-            sigma_F, _, K_v, K_beta = self.calculate_bending_stress(
-                m, z, width, torque, tip_relief=tip_relief, helix_angle=helix_angle
-            )
-            gear_desc = f'{gear_key}({self._get_gear_desc(gear_key)})'
-            stress_details[gear_desc] = sigma_F
-            
             # 记录修缘量
-            relief_amounts[gear_key] = self.calculate_tip_relief(m, tip_relief)
+            relief_amounts[gear_key] = relief
             
             # 许用应力
-            sigma_F_allow = material.sigma_f / material.safety_factor
+            sigma_F_allow = material.allow_stress
+            
+            # 追踪最大应力，取其齿轮的许用应力作为参考
+            if sigma_F > max_sigma_F:
+                max_sigma_F = sigma_F
+                ref_allow_stress = sigma_F_allow
             
             # 检查强度
             strength_ok = sigma_F <= sigma_F_allow
             
             # 齿根厚检查
-            sf = m * self.sf_factor
-            sf_ok = (sf / m) >= material.sf_min_ratio
+            sf_ok = sf_ratio >= material.sf_min_ratio
             
             gear_suitable = strength_ok and sf_ok
             if not gear_suitable:
                 all_suitable = False
             
             # 记录材质信息
-            gear_materials[gear_key] = mat_key
+            add_mat_key(mat_key)
             gear_material_names[gear_key] = material.name
             
             # 计算应力比并记录
@@ -533,30 +775,15 @@ class StrengthChecker:
                 max_stress_ratio_gear = gear_desc
             
             # 加权平均密度（按体积近似估算）
-            total_density_weighted += material.density * (z * width * m**2)
-        
-        # 最大应力
-        max_sigma_F = max(stress_details.values())
-        
-        # 取最大应力齿轮的许用应力作为参考（与最大应力对应）
-        max_stress_gear_key = max(stress_details.items(), key=lambda x: x[1])[0]
-        max_stress_gear_short = max_stress_gear_key.split('(')[0]  # 提取 z1, z2 等
-        if max_stress_gear_short in gear_materials:
-            ref_material = db[gear_materials[max_stress_gear_short]]
-            ref_allow_stress = ref_material.sigma_f / ref_material.safety_factor
-        else:
-            # 备选：取所有许用应力的平均值
-            ref_allow_stress = sum(
-                db[gear_materials[g]].sigma_f / db[gear_materials[g]].safety_factor 
-                for g in gear_materials
-            ) / len(gear_materials)
+            volume = z * width * (m * m)
+            total_volume += volume
+            total_density_weighted += material.density * volume
         
         # 综合安全裕度（基于最大应力比）
         safety_margin = 1.0 / max_stress_ratio if max_stress_ratio > 0 else float('inf')
         
-        # 生成综合名称
-        unique_materials = list(set(gear_material_names.values()))
-        combined_name = " + ".join(unique_materials) if len(unique_materials) > 1 else unique_materials[0]
+        # 生成综合名称（按 z1→z4 顺序去重）
+        combined_name = " + ".join(dict.fromkeys(gear_material_names.values()))
         
         return MaterialCheckResult(
             material_key='mixed',
@@ -567,25 +794,52 @@ class StrengthChecker:
             sf_ratio_ok=all_suitable,  # 已在各齿轮检查中包含
             suitable=all_suitable,
             safety_margin=safety_margin,
-            density=total_density_weighted / sum(z * width * m**2 for _, m, z, width, _, _, _ in gears),
-            stress_details=stress_details,
-            gear_materials=gear_materials,
+            density=total_density_weighted / total_volume,
+            stress_details=GearStresses(sigma_F1, sigma_F2, sigma_F3, sigma_F4),
+            gear_materials=GearMaterials._make(gear_mat_keys),
             gear_material_names=gear_material_names,
             tip_relief_amounts=relief_amounts,
-            contact_ratios={'stage1': epsilon_gamma1, 'stage2': epsilon_gamma2},
+            contact_ratios=contact_ratios,
             stress_ratios=stress_ratios,
             max_stress_ratio_gear=max_stress_ratio_gear
         )
     
+    def _stage_bending_stresses(
+        self,
+        m: float,
+        z_a: int,
+        z_b: int,
+        width: float,
+        torque_a: float,
+        torque_b: float,
+        tip_relief: float = 0.0,
+        helix_angle: float = 0.0
+    ) -> Tuple[float, float]:
+        """
+        计算同一级啮合两齿轮的齿根弯曲应力 (MPa)
+        
+        结果与 calculate_bending_stress（默认 Y_S、Y_ε）相同，
+        但动载系数和斜齿轮系数每级只计算一次
+        """
+        if width <= 0 or m <= 0:
+            return float('inf'), float('inf')
+        
+        K_v, K_beta = self._load_factors(tip_relief, helix_angle)
+        form_factor = self._form_factor
+        
+        stresses = []
+        for z, torque in ((z_a, torque_a), (z_b, torque_b)):
+            if z < 12:
+                stresses.append(float('inf'))
+                continue
+            stresses.append(_root_bending_stress(
+                m, z, width, torque, form_factor(z, helix_angle), K_v=K_v, K_beta=K_beta
+            ))
+        return stresses[0], stresses[1]
+    
     def _get_gear_desc(self, gear_key: str) -> str:
         """获取齿轮描述"""
-        desc_map = {
-            'z1': '一级主动',
-            'z2': '一级从动',
-            'z3': '二级主动',
-            'z4': '二级从动'
-        }
-        return desc_map.get(gear_key, gear_key)
+        return _GEAR_DESCS.get(gear_key, gear_key)
 
 
 # ==================== 便捷函数 ====================
@@ -612,9 +866,46 @@ def quick_check(
     Returns:
         (is_ok, material_name, max_stress): 是否通过、材料名、最大应力
     """
+    return _quick_check(
+        MaterialDatabase(), StrengthChecker(),
+        m1, m2, z1, z2, z3, z4, width_factor1, width_factor2,
+        torque_motor, ratio1, mode
+    )
+
+
+def quick_check_batch(
+    params: Iterable[Tuple[float, float, int, int, int, int, float, float, float, float]],
+    mode: str = 'auto'
+) -> List[Tuple[bool, str, float]]:
+    """
+    批量快速校核材料强度（参数扫描用）
+    
+    材料数据库和校核器只创建一次，各组参数共享。
+    
+    Args:
+        params: 参数组序列，每组为
+            (m1, m2, z1, z2, z3, z4, width_factor1, width_factor2, torque_motor, ratio1)
+        mode: 'auto'或指定材料
+        
+    Returns:
+        与 params 一一对应的 (is_ok, material_name, max_stress) 列表
+    """
     db = MaterialDatabase()
     checker = StrengthChecker()
-    
+    return [_quick_check(db, checker, *p, mode) for p in params]
+
+
+def _quick_check(
+    db: MaterialDatabase,
+    checker: StrengthChecker,
+    m1: float, m2: float,
+    z1: int, z2: int, z3: int, z4: int,
+    width_factor1: float, width_factor2: float,
+    torque_motor: float,
+    ratio1: float,
+    mode: str
+) -> Tuple[bool, str, float]:
+    """用给定的材料数据库和校核器执行一次快速校核"""
     width1 = width_factor1 * m1
     width2 = width_factor2 * m2
     torque1 = torque_motor
@@ -625,16 +916,8 @@ def quick_check(
         width1, width2, torque1, torque2, mode
     )
     
-    # 检查选中材料是否满足
+    # 'auto'模式已按密度顺序选出首个满足的材料，选中材料不满足即无材料满足
     result = results[selected_key]
-    if not result.suitable and mode == 'auto':
-        # 尝试其他材料
-        for key, res in results.items():
-            if res.suitable:
-                selected_key = key
-                result = res
-                break
-    
     return result.suitable, db[selected_key].name, result.max_stress
 
 